@@ -3,6 +3,44 @@ from numpy import ma as ma
 from scipy import linalg
 from scipy.sparse import linalg as splinalg
 
+from copt.utils import njit
+
+
+@njit(cache=True)
+def _argmax_abs(u):
+    """Index of the entry of u with largest absolute value.
+
+    Single fused reduction, equivalent to np.argmax(np.abs(u)) without
+    materializing the intermediate |u| array.
+    """
+    largest_coordinate = 0
+    largest_value = -1.0
+    for i in range(u.size):
+        value = abs(u[i])
+        if value > largest_value:
+            largest_value = value
+            largest_coordinate = i
+    return largest_coordinate
+
+
+@njit(cache=True)
+def _l1_lmo_update_direction(u, x, alpha):
+    """Fused kernel for the L1 ball LMO.
+
+    Computes in a single pass the coordinate of u with largest absolute
+    value, its sign, and the update direction s - x where s is the
+    corresponding vertex of the L1 ball of radius alpha. Avoids the
+    intermediate |u| array and the extra copy of x.
+    """
+    largest_coordinate = _argmax_abs(u)
+    sign = np.sign(u[largest_coordinate])
+    update_direction = np.empty_like(x)
+    for i in range(x.size):
+        update_direction[i] = -x[i]
+    update_direction[largest_coordinate] += alpha * sign
+    return update_direction, largest_coordinate, sign
+
+
 class LinfBall:
     p = np.inf
 
@@ -69,12 +107,9 @@ class L1Ball:
           max_step_size: float
               1. for a Frank-Wolfe step.
     """
-        abs_u = np.abs(u)
-        largest_coordinate = np.argmax(abs_u)
-        sign = np.sign(u[largest_coordinate])
-
-        update_direction = -x.copy()
-        update_direction[largest_coordinate] += self.alpha * sign
+        update_direction, largest_coordinate, sign = _l1_lmo_update_direction(
+            u, x, self.alpha
+        )
 
         # Only useful for active_set management in pairwise FW
         fw_vertex_rep = (sign, largest_coordinate)
@@ -107,19 +142,25 @@ class L1Ball:
           max_step_size: float
               max_step_size to not move out of the constraint. Given by active_set[away_vertex_rep].
         """
-        update_direction, fw_vertex_rep, _,  _ = self.lmo(u, x)
-        update_direction += x
-
-        def _correlation(vertex_rep, u):
-            """Compute the correlation between vertex represented by vertex_rep and vector u."""
-            sign, idx = vertex_rep
-            return sign * u[idx]
-
-        away_vertex_rep, max_step_size = min(active_set.items(),
-                                             key=lambda item: _correlation(item[0], u))
-
-        sign, idx = away_vertex_rep
-        update_direction[idx] -= sign * self.alpha
+        largest_coordinate = _argmax_abs(u)
+        fw_sign = np.sign(u[largest_coordinate])
+        fw_vertex_rep = (fw_sign, largest_coordinate)
+
+        # .. correlation of each active vertex with u, computed as a single ..
+        # .. vectorized reduction rather than a Python-level scan ..
+        vertex_reps = list(active_set)
+        signs = np.array([sign for sign, _ in vertex_reps])
+        indices = np.array([idx for _, idx in vertex_reps], dtype=np.intp)
+        away_vertex_rep = vertex_reps[np.argmin(signs * u[indices])]
+        max_step_size = active_set[away_vertex_rep]
+
+        # .. s and v are both vertices of the L1 ball with a single nonzero ..
+        # .. coordinate, so s - v is (at most) 2-sparse: build it directly ..
+        # .. instead of going through the dense s - x of the vanilla LMO ..
+        update_direction = np.zeros_like(x)
+        update_direction[largest_coordinate] += fw_sign * self.alpha
+        away_sign, away_idx = away_vertex_rep
+        update_direction[away_idx] -= away_sign * self.alpha
         return update_direction, fw_vertex_rep, away_vertex_rep, max_step_size
 
 
@@ -225,6 +266,33 @@ def euclidean_proj_l1ball(v, s=1):
     return w
 
 
+def _top_singular_vectors(G, u0, v0, tol=1e-6, max_iter=30):
+    """Approximate the leading singular vector pair of G by power iteration.
+
+    Warm-started from (u0, v0), typically the singular vectors of a nearby
+    matrix, in which case a handful of matrix-vector products suffice.
+
+    Returns:
+      (u, v) on convergence, (None, None) otherwise.
+    """
+    u, v = u0, v0
+    for _ in range(max_iter):
+        u_next = G.dot(v)
+        u_norm = linalg.norm(u_next)
+        if u_norm == 0:
+            return None, None
+        u_next /= u_norm
+        v_next = G.T.dot(u_next)
+        v_norm = linalg.norm(v_next)
+        if v_norm == 0:
+            return None, None
+        v_next /= v_norm
+        if linalg.norm(u_next - u) <= tol and linalg.norm(v_next - v) <= tol:
+            return u_next, v_next
+        u, v = u_next, v_next
+    return None, None
+
+
 class TraceBall:
     """Projection onto the trace (aka nuclear) norm, sum of singular values"""
 
@@ -234,6 +302,9 @@ class TraceBall:
         assert len(shape) == 2
         self.shape = shape
         self.alpha = alpha
+        # warm-start for the power iteration inside lmo
+        self._u_prev = None
+        self._v_prev = None
 
     def __call__(self, x):
         X = x.reshape(self.shape)
@@ -269,6 +340,14 @@ class TraceBall:
           max_step_size: 1. for a Frank-Wolfe step.
     """
         u_mat = u.reshape(self.shape)
-        ut, _, vt = splinalg.svds(u_mat, k=1)
+        ut = vt = None
+        if self._u_prev is not None:
+            # successive gradients barely move the top singular pair, so a
+            # warm-started power iteration is much cheaper than a cold svds
+            ut, vt = _top_singular_vectors(u_mat, self._u_prev, self._v_prev)
+        if ut is None:
+            ut, _, vt = splinalg.svds(u_mat, k=1)
+            ut, vt = ut.ravel(), vt.ravel()
+        self._u_prev, self._v_prev = ut, vt
         vertex = self.alpha * np.outer(ut, vt).ravel()
         return vertex - x, None, None, 1.
@@ -71,8 +71,11 @@ def backtracking_step_size(
     if old_f_t is not None:
         tmp = (certificate ** 2) / (2 * (old_f_t - f_t) * norm_update_direction)
         lipschitz_t = max(min(tmp, lipschitz_t), lipschitz_t * ratio_decrease)
+    # .. scratch buffer for the trial point, reused across retries ..
+    x_next = np.empty_like(x)
+    step_ratio = certificate / norm_update_direction
     for _ in range(max_ls_iter):
-        step_size_t = certificate / (norm_update_direction * lipschitz_t)
+        step_size_t = step_ratio / lipschitz_t
         if step_size_t < max_step_size:
             rhs = -0.5 * step_size_t * certificate
         else:
@@ -81,7 +84,9 @@ def backtracking_step_size(
                 -step_size_t * certificate
                 + 0.5 * (step_size_t ** 2) * lipschitz_t * norm_update_direction
             )
-        f_next, grad_next = f_grad(x + step_size_t * update_direction)
+        np.multiply(update_direction, step_size_t, out=x_next)
+        x_next += x
+        f_next, grad_next = f_grad(x_next)
         if f_next - f_t <= rhs + EPS:
             # .. sufficient decrease condition verified ..
             break
@@ -98,16 +103,21 @@ def update_active_set(active_set,
                       fw_vertex_rep, away_vertex_rep,
                       step_size):
 
+    if fw_vertex_rep == away_vertex_rep:
+        # moving weight from an atom onto itself is a no-op
+        return active_set
+
     max_step_size = active_set[away_vertex_rep]
+    away_weight = max_step_size - step_size
+    if away_weight < 0.:
+        raise ValueError(f"The step size used is too large. "
+                         f"{step_size: .3f} vs. {max_step_size:.3f}")
     active_set[fw_vertex_rep] += step_size
-    active_set[away_vertex_rep] -= step_size
-    
-    if active_set[away_vertex_rep] == 0.:
+    if away_weight == 0.:
         # drop step: remove vertex from active set
         del active_set[away_vertex_rep]
-    if active_set[away_vertex_rep] < 0.:
-        raise ValueError(f"The step size used is too large. "
-                         f"{step_size: .3f} vs. {max_step_size:.3f}")
+    else:
+        active_set[away_vertex_rep] = away_weight
 
     return active_set
 
@@ -248,10 +258,20 @@ def minimize_frank_wolfe(
     f_t, grad = func_and_grad(x)
     old_f_t = None
 
+    # .. scratch buffer for trial points and the iterate update, ..
+    # .. reused across iterations to avoid per-iteration temporaries ..
+    scratch = np.empty_like(x)
+
     for it in range(max_iter):
-        update_direction, fw_vertex_rep, away_vertex_rep, max_step_size = lmo(-grad, x, active_set)
+        neg_grad = -grad
+        update_direction, fw_vertex_rep, away_vertex_rep, max_step_size = lmo(neg_grad, x, active_set)
         norm_update_direction = linalg.norm(update_direction) ** 2
-        certificate = np.dot(update_direction, -grad)
+        certificate = np.dot(update_direction, neg_grad)
+
+        # .. check convergence first: a no-op direction (certificate zero) ..
+        # .. would make the probe below both useless and ill-defined ..
+        if certificate <= tol:
+            break
 
         # .. compute an initial estimate for the ..
         # .. Lipschitz estimate if not given ...
@@ -261,13 +281,13 @@ def minimize_frank_wolfe(
             lipschitz_t = linalg.norm(grad - grad_eps) / (
                 eps * np.sqrt(norm_update_direction)
             )
-            print("Estimated L_t = %s" % lipschitz_t)
-
-        if certificate <= tol:
-            break
+            if verbose:
+                print("Estimated L_t = %s" % lipschitz_t)
         if hasattr(step, "__call__"):
             step_size = step(locals())
-            f_next, grad_next = func_and_grad(x + step_size * update_direction)
+            np.multiply(update_direction, step_size, out=scratch)
+            scratch += x
+            f_next, grad_next = func_and_grad(scratch)
         elif step == "backtracking":
             step_size, lipschitz_t, f_next, grad_next = backtracking_step_size(
                 x,
@@ -286,18 +306,23 @@ def minimize_frank_wolfe(
             step_size = min(
                 certificate / (norm_update_direction * lipschitz_t), max_step_size
             )
-            f_next, grad_next = func_and_grad(x + step_size * update_direction)
+            np.multiply(update_direction, step_size, out=scratch)
+            scratch += x
+            f_next, grad_next = func_and_grad(scratch)
         elif step == "sublinear":
             # .. without knowledge of the Lipschitz constant ..
             # .. we take the sublinear 2/(k+2) step-size ..
             step_size = 2.0 / (it + 2)
-            f_next, grad_next = func_and_grad(x + step_size * update_direction)
+            np.multiply(update_direction, step_size, out=scratch)
+            scratch += x
+            f_next, grad_next = func_and_grad(scratch)
         else:
             raise ValueError("Invalid option step=%s" % step)
         if callback is not None:
             if callback(locals()) is False:  # pylint: disable=g-bool-id-comparison
                 break
-        x += step_size * update_direction
+        np.multiply(update_direction, step_size, out=scratch)
+        x += scratch
         if variant == 'pairwise':
             update_active_set(active_set, fw_vertex_rep, away_vertex_rep,
                               step_size)
@@ -6,6 +6,58 @@ from sklearn.utils.extmath import safe_sparse_dot
 from copt.utils import safe_sparse_add, njit, prange
 
 
+@njit(cache=True)
+def _logsig(x):
+    """Compute log(1 / (1 + exp(-t))) component-wise, in a single fused pass."""
+    out = np.zeros_like(x)
+    for i in range(x.size):
+        t = x[i]
+        if t < -33:
+            out[i] = t
+        elif t < -18:
+            out[i] = t - np.exp(t)
+        elif t < 37:
+            out[i] = -np.log1p(np.exp(-t))
+        else:
+            out[i] = -np.exp(-t)
+    return out
+
+
+@njit(parallel=True, cache=True)
+def _log_deriv(p, y):
+    # derivative of logistic loss
+    # same as in lightning (with minus sign)
+    out = np.zeros_like(p)
+    for i in prange(p.size):
+        if p[i] < 0:
+            exp_p = np.exp(p[i])
+            out[i] = ((1 - y[i]) * exp_p - y[i]) / (1 + exp_p)
+        else:
+            exp_nx = np.exp(-p[i])
+            out[i] = ((1 - y[i]) - y[i] * exp_nx) / (1 + exp_nx)
+    return out
+
+
+@njit(cache=True)
+def _square_deriv(p, y):
+    return p - y
+
+
+@njit(cache=True)
+def _expit_b(x, b):
+    """Compute sigmoid(x) - b component-wise, in a single fused pass."""
+    out = np.zeros_like(x)
+    for i in range(x.size):
+        t = x[i]
+        if t < 0:
+            exp_t = np.exp(t)
+            out[i] = ((1 - b[i]) * exp_t - b[i]) / (1 + exp_t)
+        else:
+            exp_nt = np.exp(-t)
+            out[i] = ((1 - b[i]) - b[i] * exp_nt) / (1 + exp_nt)
+    return out
+
+
 class LogLoss:
     r"""Logistic loss function.
 
@@ -28,6 +80,9 @@ class LogLoss:
     def __init__(self, A, b, alpha=0.0):
         if A is None:
             A = sparse.eye(b.size, b.size, format="csr")
+        elif sparse.issparse(A):
+            # CSR gives the fastest matvecs; convert once instead of per call
+            A = A.tocsr()
         self.A = A
         if np.max(b) > 1 or np.min(b) < 0:
             raise ValueError("b can only contain values between 0 and 1 ")
@@ -50,28 +105,11 @@ class LogLoss:
 
     def logsig(self, x):
         """Compute log(1 / (1 + exp(-t))) component-wise."""
-        out = np.zeros_like(x)
-        idx0 = x < -33
-        out[idx0] = x[idx0]
-        idx1 = (x >= -33) & (x < -18)
-        out[idx1] = x[idx1] - np.exp(x[idx1])
-        idx2 = (x >= -18) & (x < 37)
-        out[idx2] = -np.log1p(np.exp(-x[idx2]))
-        idx3 = x >= 37
-        out[idx3] = -np.exp(-x[idx3])
-        return out
+        return _logsig(x)
 
     def expit_b(self, x, b):
         """Compute sigmoid(x) - b."""
-        idx = x < 0
-        out = np.zeros_like(x)
-        exp_x = np.exp(x[idx])
-        b_idx = b[idx]
-        out[idx] = ((1 - b_idx) * exp_x - b_idx) / (1 + exp_x)
-        exp_nx = np.exp(-x[~idx])
-        b_nidx = b[~idx]
-        out[~idx] = ((1 - b_nidx) - b_nidx * exp_nx) / (1 + exp_nx)
-        return out
+        return _expit_b(x, b)
 
     def f_grad(self, x, return_gradient=True):
         if self.intercept:
@@ -178,21 +216,7 @@ class LogLoss:
 
     @property
     def partial_deriv(self):
-        @njit(parallel=True)
-        def log_deriv(p, y):
-            # derivative of logistic loss
-            # same as in lightning (with minus sign)
-            out = np.zeros_like(p)
-            for i in prange(p.size):
-                if p[i] < 0:
-                    exp_p = np.exp(p[i])
-                    out[i] = ((1 - y[i]) * exp_p - y[i]) / (1 + exp_p)
-                else:
-                    exp_nx = np.exp(-p[i])
-                    out[i] = ((1 - y[i]) - y[i] * exp_nx) / (1 + exp_nx)
-            return out
-
-        return log_deriv
+        return _log_deriv
 
     @property
     def lipschitz(self):
@@ -222,6 +246,8 @@ class SquareLoss:
     def __init__(self, A, b, alpha=0):
         if A is None:
             A = sparse.eye(b.size, b.size, format="csr")
+        elif sparse.issparse(A):
+            A = A.tocsr()
         self.b = b
         self.alpha = alpha
         self.A = A
@@ -243,10 +269,7 @@ class SquareLoss:
 
     @property
     def partial_deriv(self):
-        @njit
-        def square_deriv(p, y):
-            return p - y
-        return square_deriv
+        return _square_deriv
 
     @property
     def lipschitz(self):
@@ -259,6 +282,8 @@ class HuberLoss:
 
     def __init__(self, A, b, alpha=0, delta=1):
         self.delta = delta
+        if sparse.issparse(A):
+            A = A.tocsr()
         self.A = A
         self.b = b
         self.alpha = alpha
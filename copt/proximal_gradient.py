@@ -201,7 +201,7 @@ def minimize_proximal_gradient(
         # .. allows for infinite or floating point max_iter ..
         yk = x.copy()
         while True:
-            grad_fk = func_and_grad(yk)[1]
+            f_yk, grad_fk = func_and_grad(yk)
             if callback is not None:
                 if callback(locals()) is False:  # pylint: disable=g-bool-id-comparison
                     break
@@ -229,7 +229,9 @@ def minimize_proximal_gradient(
                 x_next = prox(yk - current_step_size * grad_fk, current_step_size)
                 for _ in range(max_iter_backtracking):
                     update_direction = x_next - yk
-                    if func_and_grad(x_next)[0] <= func_and_grad(yk)[0] + grad_fk.dot(
+                    # .. f_yk was evaluated together with grad_fk at the top of
+                    # .. the iteration; both are invariant across retries ..
+                    if func_and_grad(x_next)[0] <= f_yk + grad_fk.dot(
                         update_direction
                     ) + update_direction.dot(update_direction) / (
                         2.0 * current_step_size
@@ -7,7 +7,7 @@ from copt import utils
 from copt.frank_wolfe import update_active_set
 
 
-@utils.njit(nogil=True)
+@utils.njit(nogil=True, cache=True)
 def _support_matrix(A_indices, A_indptr, reverse_blocks_indices, n_blocks):
     """Compute the support matrix, used by variance-reduced algorithms.
 
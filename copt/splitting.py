@@ -132,8 +132,11 @@ def minimize_three_split(
         norm_incr = np.linalg.norm(incr)
         ls = norm_incr > 1e-7 and line_search
         if ls:
+            # .. the linearization fk + <grad_fk, incr> does not depend on ..
+            # .. the step size, so compute the inner product only once ..
+            rhs_linear = fk + grad_fk.dot(incr)
             for it_ls in range(max_iter_backtracking):
-                rhs = fk + grad_fk.dot(incr) + (norm_incr ** 2) / (2 * step_size)
+                rhs = rhs_linear + (norm_incr ** 2) / (2 * step_size)
                 ls_tol = f_grad(x, return_gradient=False) - rhs
                 if ls_tol <= LS_EPS:
                     # step size found
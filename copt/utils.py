@@ -75,7 +75,7 @@ def safe_sparse_add(a, b):
         return a + b
 
 
-@njit(parallel=True)
+@njit(parallel=True, cache=True)
 def sample_batches(n_samples, n_batches, batch_size):
     idx = np.zeros(n_batches * batch_size, dtype=np.int32)
     for k in prange(n_batches):
@@ -83,7 +83,7 @@ def sample_batches(n_samples, n_batches, batch_size):
     return idx
 
 
-@njit(nogil=True)
+@njit(nogil=True, cache=True)
 def fast_csr_vm(x, data, indptr, indices, d, idx):
     """
     Returns the vector matrix product x * M[idx]. M is described
@@ -107,7 +107,7 @@ def fast_csr_vm(x, data, indptr, indices, d, idx):
     return res
 
 
-@njit(nogil=True)
+@njit(nogil=True, cache=True)
 def fast_csr_mv(data, indptr, indices, x, idx):
     """
     Returns the matrix vector product M[idx] * x. M is described